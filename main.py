@@ -10,37 +10,13 @@ Usage
   python main.py --no-cli  # web UI only (used by systemd service)
 """
 
-import sys
 import logging
 import argparse
 from pathlib import Path
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s  %(levelname)-8s  %(message)s",
-    datefmt="%H:%M:%S",
-)
 logger = logging.getLogger(__name__)
 
 
-def load_config(path: Path) -> dict:
-    try:
-        import tomllib
-    except ImportError:
-        try:
-            import tomli as tomllib
-        except ImportError:
-            print("ERROR: TOML library missing. Run: pip install tomli")
-            sys.exit(1)
-
-    if not path.exists():
-        print(f"ERROR: config file not found at {path}")
-        sys.exit(1)
-
-    with open(path, "rb") as f:
-        return tomllib.load(f)
-
-
 def main():
     parser = argparse.ArgumentParser(description="Thermal Typer")
     parser.add_argument(
@@ -50,6 +26,14 @@ def main():
     )
     args = parser.parse_args()
 
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s  %(levelname)-8s  %(message)s",
+        datefmt="%H:%M:%S",
+    )
+
+    from typewriter.config import load_config
+
     config = load_config(Path("config.toml"))
     logger.info("Config loaded.")
 
@@ -57,7 +41,7 @@ def main():
     from typewriter import web
 
     printer = Printer(config["printer"])
-    logger.info("Printer initialised (will connect on first use).")
+    logger.info("Printer initialised (connecting in the background).")
 
     # Always start the web UI
     web.run(printer, config["web"])
@@ -0,0 +1,100 @@
+"""
+tests/test_config.py
+────────────────────
+load_config() and its pickle cache: when it's trusted,
+when it's ignored, and that it never stops startup.
+"""
+
+import os
+import pickle
+import sys
+
+import pytest
+
+from typewriter import config
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    path = tmp_path / "cache" / "config.pkl"
+    monkeypatch.setattr(config, "CONFIG_CACHE", path)
+    config.load_config.cache_clear()
+    yield path
+    config.load_config.cache_clear()
+
+
+@pytest.fixture
+def toml(tmp_path):
+    path = tmp_path / "config.toml"
+    path.write_text('[printer]\nchars_per_line = 37\n')
+    return path
+
+
+def _reload(path):
+    config.load_config.cache_clear()
+    return config.load_config(path)
+
+
+def test_parses_and_writes_cache(cache, toml):
+    assert config.load_config(toml) == {"printer": {"chars_per_line": 37}}
+    assert cache.exists()
+
+
+def test_cache_hit_skips_toml_import(cache, toml, monkeypatch):
+    expected = config.load_config(toml)
+    # Any TOML import now fails — and load_config exits if it tries one
+    monkeypatch.setitem(sys.modules, "tomllib", None)
+    monkeypatch.setitem(sys.modules, "tomli", None)
+    assert _reload(toml) == expected
+
+
+def test_mtime_change_forces_reparse(cache, toml):
+    config.load_config(toml)
+    st = os.stat(toml)
+    toml.write_text('[printer]\nchars_per_line = 42\n')     # same size
+    os.utime(toml, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert _reload(toml) == {"printer": {"chars_per_line": 42}}
+
+
+def test_size_change_forces_reparse(cache, toml):
+    config.load_config(toml)
+    st = os.stat(toml)
+    toml.write_text('[printer]\nchars_per_line = 100\n')    # one byte longer
+    os.utime(toml, ns=(st.st_atime_ns, st.st_mtime_ns))      # same mtime
+    assert _reload(toml) == {"printer": {"chars_per_line": 100}}
+
+
+@pytest.mark.parametrize("payload", [
+    b"not a pickle",
+    b"",
+    pickle.dumps([1, 2, 3]),
+    pickle.dumps("config"),
+    pickle.dumps({"key": None}),
+    pickle.dumps({"data": {}}),
+])
+def test_bad_cache_is_a_miss(cache, toml, payload):
+    cache.parent.mkdir(parents=True)
+    cache.write_bytes(payload)
+    assert config.load_config(toml) == {"printer": {"chars_per_line": 37}}
+
+
+def test_cache_with_non_dict_data_is_a_miss(cache, toml):
+    config.load_config(toml)
+    st = os.stat(toml)
+    key = (str(toml.resolve()), st.st_mtime_ns, st.st_size)
+    cache.write_bytes(pickle.dumps({"key": key, "data": ["stale"]}))
+    assert _reload(toml) == {"printer": {"chars_per_line": 37}}
+
+
+def test_unwritable_cache_dir_is_not_fatal(tmp_path, toml, monkeypatch):
+    # A file where the cache directory should be — mkdir can't succeed
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    monkeypatch.setattr(config, "CONFIG_CACHE", blocker / "config.pkl")
+    assert _reload(toml) == {"printer": {"chars_per_line": 37}}
+    config.load_config.cache_clear()
+
+
+def test_missing_file_exits(cache, tmp_path):
+    with pytest.raises(SystemExit):
+        config.load_config(tmp_path / "nope.toml")
@@ -0,0 +1,136 @@
+"""
+tests/test_dispatcher.py
+────────────────────────
+dispatch() against a stub printer: what comes back, and
+what (if anything) was sent to the printer.
+"""
+
+import pytest
+
+from typewriter.dispatcher import EXIT_RESPONSE, _MAX_KEYWORD_LEN, dispatch, is_command
+from typewriter.printer import PrinterError
+from typewriter.shortcuts import resolve
+
+
+class StubPrinter:
+    """Records every call instead of printing."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        def record(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+        return record
+
+
+class OfflinePrinter:
+    """Raises on every call, like Printer while the USB device is gone."""
+
+    def __getattr__(self, name):
+        def fail(*args, **kwargs):
+            raise PrinterError("Printer offline.")
+        return fail
+
+
+def _shortcut_call(key):
+    text, opts = resolve(key)
+    return ("print_text", (text,), opts)
+
+
+LONG_WORD = "x" * (_MAX_KEYWORD_LEN + 1)
+LONG_LINE = "the quick brown fox jumps over the lazy dog"
+
+
+# (input, expected message, expected printed, expected printer calls)
+CASES = [
+    # Empty input feeds one blank line
+    ("",        "(blank line printed)", True, [("feed", (), {})]),
+    ("   \n",   "(blank line printed)", True, [("feed", (), {})]),
+
+    # Commands are bare words, any case
+    ("cut",     "Paper cut.",           True, [("cut", (), {})]),
+    ("  CUT ",  "Paper cut.",           True, [("cut", (), {})]),
+    ("exit",    "__EXIT__",             False, []),
+    ("QUIT",    "__EXIT__",             False, []),
+
+    # A "!" makes it a shortcut lookup, not a command
+    ("!cut",    "Printed.",             True, [("print_text", ("!cut",), {})]),
+
+    # Static shortcuts, with and without "!"
+    ("test",    "Shortcut 'test' printed.", True, [_shortcut_call("test")]),
+    ("!test",   "Shortcut 'test' printed.", True, [_shortcut_call("test")]),
+    ("!TEST",   "Shortcut 'test' printed.", True, [_shortcut_call("test")]),
+    ("cat",     "Shortcut 'cat' printed.",  True, [_shortcut_call("cat")]),
+    ("!cat",    "Shortcut 'cat' printed.",  True, [_shortcut_call("cat")]),
+    ("! cat",   "Shortcut 'cat' printed.",  True, [_shortcut_call("cat")]),
+    ("!!cat",   "Shortcut 'cat' printed.",  True, [_shortcut_call("cat")]),
+    ("  Cat  ", "Shortcut 'cat' printed.",  True, [_shortcut_call("cat")]),
+
+    # Plain text is printed stripped, original case kept
+    ("hello",       "Printed.", True, [("print_text", ("hello",), {})]),
+    ("  Hello  ",   "Printed.", True, [("print_text", ("Hello",), {})]),
+    ("!nope",       "Printed.", True, [("print_text", ("!nope",), {})]),
+    ("cat food",    "Printed.", True, [("print_text", ("cat food",), {})]),
+    (LONG_WORD,     "Printed.", True, [("print_text", (LONG_WORD,), {})]),
+    (LONG_LINE,     "Printed.", True, [("print_text", (LONG_LINE,), {})]),
+]
+
+
+@pytest.mark.parametrize("text, message, printed, calls", CASES)
+def test_dispatch(text, message, printed, calls):
+    printer = StubPrinter()
+    resp = dispatch(text, printer, {})
+    assert resp.message == message
+    assert resp.printed is printed
+    assert resp.error is False
+    assert printer.calls == calls
+
+
+def test_exit_is_shared_response():
+    assert dispatch("exit", StubPrinter(), {}) is EXIT_RESPONSE
+
+
+@pytest.mark.parametrize("text", ["help", "HELP", "shortcuts", " help "])
+def test_help_lists_shortcuts_without_printing(text):
+    printer = StubPrinter()
+    resp = dispatch(text, printer, {})
+    assert resp.printed is False
+    assert resp.error is False
+    assert resp.message.startswith("Available shortcuts:")
+    assert "  !cat" in resp.message
+    assert "Commands: cut, exit, help" in resp.message
+    assert printer.calls == []
+
+
+def test_dynamic_shortcut_prints_fresh_text():
+    printer = StubPrinter()
+    resp = dispatch("!time", printer, {})
+    assert resp.message == "Shortcut 'time' printed."
+    [(name, args, kwargs)] = printer.calls
+    assert name == "print_text"
+    assert args[0].startswith("Time: ")
+
+
+@pytest.mark.parametrize("text", ["", "cut", "!test", "hello", LONG_LINE])
+def test_printer_errors_become_error_responses(text):
+    resp = dispatch(text, OfflinePrinter(), {})
+    assert resp.error is True
+    assert resp.printed is False
+    assert resp.message == "Printer error: Printer offline."
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("",         False),
+    ("cut",      True),
+    ("exit",     True),
+    ("help",     True),
+    ("cat",      True),
+    ("!cat",     True),
+    ("! cat",    True),
+    ("hello",    False),
+    ("!nope",    False),
+    (LONG_LINE,  False),
+])
+def test_is_command(text, expected):
+    assert is_command(text) is expected
@@ -0,0 +1,150 @@
+"""
+tests/test_printer.py
+─────────────────────
+_wrap_fixed() against the textwrap.wrap() call it replaced, and
+how Printer handles the USB device going away.
+"""
+
+import random
+import textwrap
+
+import pytest
+
+import typewriter.printer as printer_mod
+from typewriter.printer import Printer, PrinterError, _wrap_fixed
+
+
+@pytest.mark.parametrize("para, width, expected", [
+    ("hello world", 20, ["hello world"]),
+    ("hello world", 5, ["hello", "world"]),
+    ("hello   world", 8, ["hello", "world"]),
+    ("  indented text", 20, ["  indented text"]),
+    (" bbbaabb  ", 7, ["bbbaabb"]),          # indent dropped, word fits alone
+    ("        ab", 5, ["ab"]),               # indent wider than a line
+    ("\t\t\t\t\tHello there", 37, ["Hello there"]),
+    ("well-known fact", 12, ["well-known", "fact"]),   # no break at hyphens
+    ("a\tb", 20, ["a       b"]),
+    ("   ", 5, []),
+    ("", 5, []),
+    # Longer than a line: hard-broken at width
+    ("abcdefghij", 4, ["abcd", "efgh", "ij"]),
+    ("ab cdefghij", 4, ["ab", "cdef", "ghij"]),
+])
+def test_wrap_fixed(para, width, expected):
+    assert _wrap_fixed(para, width) == expected
+
+
+def test_matches_textwrap_when_every_word_fits():
+    rnd = random.Random(0)
+    checked = 0
+    while checked < 20_000:
+        width = rnd.randint(1, 14)
+        para = "".join(rnd.choice("ab-  \t") for _ in range(rnd.randint(0, 40)))
+        if any(len(w) > width for w in para.expandtabs().split()):
+            continue
+        expected = textwrap.wrap(
+            para, width, break_long_words=False, break_on_hyphens=False
+        )
+        assert _wrap_fixed(para, width) == expected, (para, width)
+        checked += 1
+
+
+# ── Connection loss ──────────────────────────────────────────────── #
+
+class FakeDevice:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.written = []
+        self.closed = False
+
+    def _raw(self, data):
+        if self.fail:
+            raise OSError("No such device")
+        self.written.append(data)
+
+    def close(self):
+        self.closed = True
+
+
+class NoThread:
+    """Stands in for the reconnect thread — tests set the device by hand."""
+
+    def __init__(self, **kwargs):
+        pass
+
+    def start(self):
+        pass
+
+
+@pytest.fixture
+def printer(monkeypatch):
+    monkeypatch.setattr(printer_mod, "Thread", NoThread)
+    p = Printer({"bottom_margin_lines": 2})
+    p._dev = FakeDevice()
+    p._status_etag = 1
+    return p
+
+
+def test_write_goes_out(printer):
+    printer.print_text("hi")
+    assert printer._dev.written == [b"hi\n"]
+
+
+def test_failed_write_marks_printer_offline(printer):
+    dev = printer._dev
+    dev.fail = True
+    with pytest.raises(PrinterError):
+        printer.print_text("hi")
+    assert dev.closed
+    assert not printer.is_connected()
+    assert int(printer.status_etag) % 2 == 0
+    assert printer._wake.is_set()
+
+    # Fails fast from now on, without touching the dead handle
+    with pytest.raises(PrinterError, match="offline"):
+        printer.feed()
+
+
+def test_mark_disconnected_flips_etag_once(printer):
+    printer.mark_disconnected()
+    printer.mark_disconnected()
+    assert printer.status_etag == "2"
+    assert printer._wake.is_set()
+
+
+def test_raw_cached_text_is_composed_once(printer):
+    art = " /\\_/\\ €"
+    printer.print_text(art, raw=True, cache=True)
+    printer.print_text(art, raw=True, cache=True)
+    assert printer._dev.written == [b" /\\_/\\ ?\n"] * 2
+    assert list(printer._composed) == [(art, True)]
+
+
+@pytest.mark.parametrize("char, expected", [
+    ("a", [b"a"]),
+    ("\n", [b"\n"]),
+    ("é", [b"\x82"]),
+    ("€", [b"?"]),          # printable but not in cp437
+    ("\t", []),
+    ("\x1b", []),
+    ("\x7f", []),
+    ("\x85", []),
+    ("\u200b", []),
+    ("\u2028", []),
+])
+def test_print_char_filter(printer, char, expected):
+    printer.print_char(char)
+    assert printer._dev.written == expected
+
+
+@pytest.mark.parametrize("chars, expected", [
+    ("hello", [b"hello"]),
+    ("a\nb", [b"a\nb"]),
+    ("a\tb\x1b[1m\x7f", [b"ab[1m"]),
+    ("café\x85", [b"caf\x82"]),
+    ("a\u200bb\u2028c", [b"abc"]),
+    ("\x01\x02", []),
+])
+def test_print_chars_filter(printer, chars, expected):
+    printer.print_chars(chars)
+    assert printer._dev.written == expected
@@ -0,0 +1,160 @@
+"""
+tests/test_web.py
+─────────────────
+The UI page's encodings, /status conditional responses,
+and how request bodies are read.
+"""
+
+import gzip
+
+import pytest
+
+from typewriter import web
+from typewriter.web import MAX_BODY, create_app
+
+
+class StubPrinter:
+    status_etag = "1"
+
+    def __init__(self):
+        self.calls = []
+
+    def is_connected(self):
+        return True
+
+    def __getattr__(self, name):
+        def record(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+        return record
+
+
+@pytest.fixture
+def printer():
+    return StubPrinter()
+
+
+@pytest.fixture
+def client(printer):
+    return create_app(printer, {}).test_client()
+
+
+# ── UI page ──────────────────────────────────────────────────────── #
+
+@pytest.mark.parametrize("accept", [None, "identity", "deflate", "gzip;q=0"])
+def test_index_uncompressed(client, accept):
+    headers = {"Accept-Encoding": accept} if accept else {}
+    resp = client.get("/", headers=headers)
+    assert resp.status_code == 200
+    assert "Content-Encoding" not in resp.headers
+    assert resp.data == web._HTML_BYTES
+    assert resp.headers["ETag"] == f'"{web._HTML_ETAG}"'
+    assert resp.headers["Vary"] == "Accept-Encoding"
+
+
+def test_index_gzip(client):
+    resp = client.get("/", headers={"Accept-Encoding": "gzip, deflate"})
+    assert resp.status_code == 200
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(resp.data) == web._HTML_BYTES
+    assert resp.headers["ETag"] == f'"{web._HTML_ETAG}-gzip"'
+    assert resp.headers["Vary"] == "Accept-Encoding"
+    assert resp.cache_control.public
+    assert resp.cache_control.max_age == 3600
+
+
+def test_index_prefers_brotli_when_available(client):
+    resp = client.get("/", headers={"Accept-Encoding": "gzip, br"})
+    expected = "br" if web.brotli is not None else "gzip"
+    assert resp.headers["Content-Encoding"] == expected
+
+
+@pytest.mark.parametrize("accept, tag", [
+    (None, ""),
+    ("gzip", "-gzip"),
+])
+def test_index_304_per_encoding(client, accept, tag):
+    headers = {"Accept-Encoding": accept} if accept else {}
+    etag = f'"{web._HTML_ETAG}{tag}"'
+    resp = client.get("/", headers={**headers, "If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.data == b""
+    assert resp.headers["ETag"] == etag
+    assert resp.headers["Vary"] == "Accept-Encoding"
+
+
+def test_index_other_encodings_tag_does_not_match(client):
+    headers = {"Accept-Encoding": "gzip", "If-None-Match": f'"{web._HTML_ETAG}"'}
+    resp = client.get("/", headers=headers)
+    assert resp.status_code == 200
+    assert resp.headers["Content-Encoding"] == "gzip"
+
+
+# ── /status ──────────────────────────────────────────────────────── #
+
+def test_status_sends_etag(client):
+    resp = client.get("/status")
+    assert resp.status_code == 200
+    assert resp.get_json() == {"connected": True}
+    assert resp.headers["ETag"] == '"1"'
+    assert resp.headers["Cache-Control"] == "no-cache"
+
+
+def test_status_304_keeps_validators(client):
+    resp = client.get("/status", headers={"If-None-Match": '"1"'})
+    assert resp.status_code == 304
+    assert resp.data == b""
+    assert resp.headers["ETag"] == '"1"'
+    assert resp.headers["Cache-Control"] == "no-cache"
+
+
+def test_status_changed_state_gets_full_response(client):
+    resp = client.get("/status", headers={"If-None-Match": '"0"'})
+    assert resp.status_code == 200
+    assert resp.headers["ETag"] == '"1"'
+
+
+# ── Request bodies ───────────────────────────────────────────────── #
+
+def test_print_dispatches_text(client, printer):
+    resp = client.post("/print", data=b'{"text": "hello"}')
+    assert resp.status_code == 200
+    assert resp.get_json() == {"printed": True, "message": "Printed.", "error": False}
+    assert printer.calls == [("print_text", ("hello",), {})]
+
+
+@pytest.mark.parametrize("body", [
+    b"{not json",
+    b"",
+    b"[1, 2]",
+    b'"hello"',
+    b'{"text": 5}',
+    b'{"text": null}',
+])
+def test_print_rejects_bad_bodies(client, printer, body):
+    resp = client.post("/print", data=body)
+    assert resp.status_code == 400
+    assert resp.get_json()["error"] is True
+    assert printer.calls == []
+
+
+def test_oversized_body_is_refused(client, printer):
+    resp = client.post("/print", data=b"x" * (MAX_BODY + 1))
+    assert resp.status_code == 413
+    assert printer.calls == []
+
+
+def test_char_reads_raw_body(client, printer):
+    resp = client.post("/char", data="éx".encode("utf-8"))
+    assert resp.get_json() == {"ok": True}
+    assert printer.calls == [("print_char", ("é",), {})]
+
+
+def test_chars_reads_raw_body(client, printer):
+    resp = client.post("/chars", data="héllo\n".encode("utf-8"))
+    assert resp.get_json() == {"ok": True}
+    assert printer.calls == [("print_chars", ("héllo\n",), {})]
+
+
+def test_empty_chars_prints_nothing(client, printer):
+    assert client.post("/chars", data=b"").get_json() == {"ok": True}
+    assert printer.calls == []
@@ -0,0 +1,25 @@
+"""
+typewriter
+──────────
+Thermal Typer package.
+
+Submodules are loaded on first attribute access (PEP 562),
+so `import typewriter` costs nothing and `typewriter.web`
+doesn't pull in Flask until something actually uses it.
+"""
+
+import importlib
+
+_LAZY = {"cli", "config", "dispatcher", "printer", "shortcuts", "web"}
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        mod = importlib.import_module(f".{name}", __name__)
+        globals()[name] = mod
+        return mod
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY)
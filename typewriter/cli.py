@@ -6,9 +6,18 @@ Terminal (SSH) interface.
 Two modes:
 
   Live mode (default)
-    Every keystroke prints immediately — real typewriter feel.
-    Backspace removes the character from your screen but prints
-    a [BS] marker on paper. Thermal paper can't erase.
+    Prints as you type — real typewriter feel. Two styles,
+    picked with live_style in the [cli] section of config.toml:
+
+      autowrap (default)
+        Each line goes to paper once it fills up, word-wrapped.
+        Backspace fixes the line before it prints.
+
+      per_key
+        Every keystroke goes to paper. Keys are sent in small
+        bursts whenever you pause (live_idle_ms), so backspace
+        can only take back what hasn't been sent yet.
+        Thermal paper can't erase.
 
   Line mode
     Type a full line, press Enter to print.
@@ -20,11 +29,12 @@ Toggle between modes at runtime:
 """
 
 import logging
+import os
+import select
 import sys
 import tty
 import termios
-
-from .dispatcher import dispatch, Response
+from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
@@ -41,102 +51,148 @@ BANNER = """
 ║  /line   →  line mode (per Enter)    ║
 ╚══════════════════════════════════════╝
 """
+BANNER_BYTES = (BANNER + "\n").encode("utf-8")
+
+# ASCII printable lookup, indexed by input byte
+_PRINTABLE = bytes(1 if 0x20 <= c < 0x7F else 0 for c in range(0x80))
 
 
 # ── Raw keypress reader ───────────────────────────────────────────── #
 
-def _getch():
-    """Read a single raw character from stdin without waiting for Enter."""
-    fd = sys.stdin.fileno()
+@contextmanager
+def _raw_terminal(fd: int):
+    """
+    Put the terminal in raw mode for the duration of the block.
+
+    Output post-processing stays on so print() still moves to the
+    start of the next line. The original settings are restored on exit.
+    """
     old = termios.tcgetattr(fd)
     try:
         tty.setraw(fd)
-        ch = sys.stdin.read(1)
+        mode = termios.tcgetattr(fd)
+        mode[1] |= termios.OPOST
+        termios.tcsetattr(fd, termios.TCSANOW, mode)
+        yield
     finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old)
-    return ch
+        termios.tcsetattr(fd, termios.TCSANOW, old)
+
+
+def _pop_char(buf: bytearray) -> None:
+    """Drop the last character from a UTF-8 buffer, continuation bytes included."""
+    end = len(buf) - 1
+    while end and buf[end] & 0xC0 == 0x80:
+        end -= 1
+    del buf[end:]
+
+
+def _read_utf8(fd: int, b: bytes) -> str:
+    """
+    Finish reading a multi-byte UTF-8 character.
+    b holds the lead byte, already read by the caller.
+    """
+    lead = b[0]
+    need = 3 if lead >= 0xF0 else 2 if lead >= 0xE0 else 1 if lead >= 0xC0 else 0
+    while need:
+        more = os.read(fd, need)
+        if not more:
+            break
+        b += more
+        need -= len(more)
+    return b.decode("utf-8", "replace")
 
 
 # ── Live mode ─────────────────────────────────────────────────────── #
 
-def _run_live(printer, config: dict):
+def _run_live_autowrap(printer, config: dict, width: int):
     """
-    Live mode — auto-prints when the line fills up.
+    Live mode, autowrap style — auto-prints when the line fills up.
     No Enter needed. Silent on success.
     Commands are detected when you press Enter on a command word.
     """
+    from .dispatcher import dispatch
+
     print("[LIVE MODE] Prints automatically as you type.")
     print("Press Enter after a command (exit, cut, !shortcut, /line).\n")
 
-    width = config.get("chars_per_line", 37)
-    buf = []
+    buf = bytearray()   # UTF-8 bytes of the current line, reused per line
+    cols = 0            # characters in buf
 
-    while True:
-        ch = _getch()
-        code = ord(ch)
+    fd = sys.stdin.fileno()
+    out = sys.stdout.buffer.write
+    flush = sys.stdout.buffer.flush
+
+    with _raw_terminal(fd):
+        while True:
+            # Raw bytes — ASCII keys never go through a decoder
+            b = os.read(fd, 1)
+            code = b[0] if b else 4   # EOF behaves like Ctrl-D
+
+            # Ctrl-C or Ctrl-D
+            if code in (3, 4):
+                print("\nExiting.")
+                return "exit"
 
-        # Ctrl-C or Ctrl-D
-        if code in (3, 4):
-            print("\nExiting.")
-            return "exit"
+            # Enter — only used for commands
+            if code in (13, 10):
+                line = buf.decode("utf-8", "replace").strip()
+                buf.clear()
+                cols = 0
+                print()
 
-        # Enter — only used for commands
-        if ch in ("\r", "\n"):
-            line = "".join(buf).strip()
-            buf.clear()
-            print()
+                if not line:
+                    try:
+                        printer.feed()
+                    except Exception as e:
+                        print(f"[Printer error: {e}]")
+                    continue
 
-            if not line:
-                try:
-                    printer.print_char("\n")
-                except Exception as e:
-                    print(f"[Printer error: {e}]")
+                if line[:1] == "/" and line.lower() == "/line":
+                    print("[Switching to line mode]")
+                    return "line"
+
+                resp = dispatch(line, printer, config)
+
+                if resp.message == "__EXIT__":
+                    print("Goodbye!")
+                    return "exit"
+
+                if resp.error:
+                    print(f"  {resp.message}")
                 continue
 
-            if line.lower() == "/line":
-                print("[Switching to line mode]")
-                return "line"
+            # Backspace — fix screen only, no printer marker
+            if code in (127, 8):
+                if buf:
+                    _pop_char(buf)
+                    cols -= 1
+                    out(b"\b \b")
+                    flush()
+                continue
 
-            resp = dispatch(line, printer, config)
+            # Escape sequences (arrow keys etc) — skip
+            if code == 27:
+                os.read(fd, 2)
+                continue
 
-            if resp.message == "__EXIT__":
-                print("Goodbye!")
-                return "exit"
+            # Non-ASCII — assemble the full character, re-encode cleanly
+            if code >= 0x80:
+                ch = _read_utf8(fd, b)
+                if not ch.isprintable():
+                    continue
+                b = ch.encode()
+            elif not _PRINTABLE[code]:
+                continue
 
-            if resp.error:
-                print(f"  {resp.message}")
-            continue
-
-        # Backspace — fix screen only, no printer marker
-        if code in (127, 8):
-            if buf:
-                buf.pop()
-                sys.stdout.write("\b \b")
-                sys.stdout.flush()
-            continue
-
-        # Escape sequences (arrow keys etc) — skip
-        if code == 27:
-            fd = sys.stdin.fileno()
-            old = termios.tcgetattr(fd)
-            try:
-                tty.setraw(fd)
-                sys.stdin.read(2)
-            except Exception:
-                pass
-            finally:
-                termios.tcsetattr(fd, termios.TCSADRAIN, old)
-            continue
-
-        # Printable character
-        if ch.isprintable():
-            buf.append(ch)
-            sys.stdout.write(ch)
-            sys.stdout.flush()
+            # Printable character
+            buf += b
+            cols += 1
+            out(b)
+            flush()
 
             # Auto-print when buffer hits line width
-            if len(buf) >= width:
-                line = "".join(buf)
+            if cols >= width:
+                line = buf.decode("utf-8", "replace")
 
                 # Break at the last space for word wrapping
                 last_space = line.rfind(" ")
@@ -147,7 +203,8 @@ def _run_live(printer, config: dict):
                     to_print = line
                     leftover = ""
 
-                buf = list(leftover)
+                buf[:] = leftover.encode()
+                cols = len(leftover)
                 print()  # just move cursor to next line, no rewriting
 
                 try:
@@ -156,12 +213,137 @@ def _run_live(printer, config: dict):
                     print(f"[Printer error: {e}]")
 
 
+def _run_live_per_key(printer, config: dict, width: int):
+    """
+    Live mode, per_key style — every keystroke goes to paper.
+
+    Keys collect in `pending` and are sent in one write as soon
+    as typing pauses for live_idle_ms, or on Enter. Lines are
+    hard-wrapped at chars_per_line. Commands still run on Enter,
+    after the typed text itself has printed.
+    """
+    from .dispatcher import dispatch, is_command
+
+    print("[LIVE MODE] Every key prints as you type.")
+    print("Press Enter after a command (exit, cut, !shortcut, /line).\n")
+
+    idle = config.get("live_idle_ms", 150) / 1000
+    buf = bytearray()   # UTF-8 bytes of the current line, for commands
+    pending = []        # typed characters not yet sent to the printer
+    col = 0             # position on the paper line
+
+    fd = sys.stdin.fileno()
+    out = sys.stdout.buffer.write
+    flush = sys.stdout.buffer.flush
+
+    def send():
+        if not pending:
+            return
+        chars = "".join(pending)
+        pending.clear()
+        try:
+            printer.print_chars(chars)
+        except Exception as e:
+            print(f"[Printer error: {e}]")
+
+    with _raw_terminal(fd):
+        while True:
+            # Typing paused — send whatever is waiting
+            if pending and not select.select([fd], [], [], idle)[0]:
+                send()
+                continue
+
+            b = os.read(fd, 1)
+            code = b[0] if b else 4   # EOF behaves like Ctrl-D
+
+            # Ctrl-C or Ctrl-D
+            if code in (3, 4):
+                send()
+                print("\nExiting.")
+                return "exit"
+
+            # Enter — newline on paper, then run any command
+            if code in (13, 10):
+                line = buf.decode("utf-8", "replace").strip()
+                buf.clear()
+                pending.append("\n")
+                col = 0
+                send()
+                print()
+
+                if not line:
+                    continue
+
+                if line[:1] == "/" and line.lower() == "/line":
+                    print("[Switching to line mode]")
+                    return "line"
+
+                if not is_command(line):
+                    continue
+
+                resp = dispatch(line, printer, config)
+
+                if resp.message == "__EXIT__":
+                    print("Goodbye!")
+                    return "exit"
+
+                if resp.error:
+                    print(f"  {resp.message}")
+                continue
+
+            # Backspace — only what hasn't reached the paper yet
+            if code in (127, 8):
+                if pending and pending[-1] != "\n":
+                    pending.pop()
+                    _pop_char(buf)
+                    col -= 1
+                    out(b"\b \b")
+                    flush()
+                continue
+
+            # Escape sequences (arrow keys etc) — skip
+            if code == 27:
+                os.read(fd, 2)
+                continue
+
+            if code >= 0x80:
+                ch = _read_utf8(fd, b)
+                if not ch.isprintable():
+                    continue
+                b = ch.encode()
+            elif _PRINTABLE[code]:
+                ch = chr(code)
+            else:
+                continue
+
+            # Printable character
+            pending.append(ch)
+            buf += b
+            col += 1
+            out(b)
+            flush()
+
+            # Hard wrap at the paper width
+            if col >= width:
+                pending.append("\n")
+                col = 0
+                print()
+
+
+_LIVE_STYLES = {
+    "autowrap": _run_live_autowrap,
+    "per_key":  _run_live_per_key,
+}
+
+
 # ── Line mode ─────────────────────────────────────────────────────── #
 
 def _run_line(printer, config: dict):
     """
     Line mode — type a full line and press Enter to print.
     """
+    from .dispatcher import dispatch, Response
+
     print("[LINE MODE] Press Enter to print each line.")
     print("Type '/live' to switch to live mode.\n")
 
@@ -172,7 +354,7 @@ def _run_line(printer, config: dict):
             print("\nExiting.")
             return "exit"
 
-        if line.lower() == "/live":
+        if line[:1] == "/" and line.lower() == "/live":
             return "live"
 
         resp: Response = dispatch(line, printer, config)
@@ -192,14 +374,23 @@ def run(printer, config: dict):
     """
     Start the CLI loop.
     Reads live_mode from config to decide starting mode.
+    Settings used inside the key loops are read once, here.
     """
-    print(BANNER)
+    sys.stdout.buffer.write(BANNER_BYTES)
+    sys.stdout.buffer.flush()
 
     mode = "live" if config.get("live_mode", True) else "line"
+    width = config.get("chars_per_line", 37)
+
+    style = config.get("live_style", "autowrap")
+    run_live = _LIVE_STYLES.get(style)
+    if run_live is None:
+        logger.warning("Unknown live_style %r — using autowrap.", style)
+        run_live = _run_live_autowrap
 
     while True:
         if mode == "live":
-            result = _run_live(printer, config)
+            result = run_live(printer, config, width)
         else:
             result = _run_line(printer, config)
 
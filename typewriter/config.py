@@ -0,0 +1,85 @@
+"""
+typewriter/config.py
+────────────────────
+Loads config.toml.
+
+Every entry point goes through load_config() so the TOML
+import and parse happen in one place. A parsed copy is kept
+in ~/.cache/thermal-typer, keyed on the file's path, mtime
+and size — an unchanged file never touches the TOML parser.
+"""
+
+import functools
+import logging
+import os
+import pickle
+import sys
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+CONFIG_CACHE = Path.home() / ".cache" / "thermal-typer" / "config.pkl"
+
+
+def _read_config_cache(key: tuple):
+    """Return the cached config if it was parsed from this exact file, else None."""
+    # Anything unexpected — missing, corrupt, an older format — is just a miss
+    try:
+        with open(CONFIG_CACHE, "rb") as f:
+            cached = pickle.load(f)
+        if cached["key"] == key and isinstance(cached["data"], dict):
+            return cached["data"]
+    except Exception:
+        pass
+    return None
+
+
+def _write_config_cache(key: tuple, cfg: dict) -> None:
+    """Atomically replace the config cache. Failure is never fatal."""
+    try:
+        CONFIG_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = CONFIG_CACHE.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump({"key": key, "data": cfg}, f)
+        os.replace(tmp, CONFIG_CACHE)
+    except OSError as e:
+        logger.debug("Could not write config cache: %s", e)
+
+
+@functools.cache
+def load_config(path: Path) -> dict:
+    """
+    Parse config.toml. Exits with a message if it can't be read.
+
+    The result is memoised per path for the life of the process,
+    and pickled to CONFIG_CACHE so the next start can skip TOML
+    parsing if the file hasn't changed.
+    """
+    # One stat() both checks the file exists and keys the cache
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        print(f"ERROR: config file not found at {path}")
+        sys.exit(1)
+
+    # Unchanged file → reuse the last parse, no TOML import at all
+    key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+    cfg = _read_config_cache(key)
+    if cfg is not None:
+        return cfg
+
+    try:
+        import tomllib
+    except ImportError:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            print("ERROR: TOML library missing. Run: pip install tomli")
+            sys.exit(1)
+
+    with open(path, "rb") as f:
+        cfg = tomllib.load(f)
+
+    _write_config_cache(key, cfg)
+    return cfg
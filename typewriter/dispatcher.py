@@ -16,11 +16,21 @@ Response fields
 
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import lru_cache
 
-from .shortcuts import resolve, list_shortcuts
+from .shortcuts import SHORTCUTS, resolve, list_shortcuts
 
+_EXIT_CMDS = frozenset(("exit", "quit"))
+_HELP_CMDS = frozenset(("help", "shortcuts"))
 
-@dataclass
+# Anything longer than the longest keyword (and not starting with "!")
+# can only be plain text, so it skips the lowercase copy entirely.
+_MAX_KEYWORD_LEN = max(
+    len(k) for k in ("cut", *_EXIT_CMDS, *_HELP_CMDS, *SHORTCUTS)
+)
+
+
+@dataclass(slots=True, frozen=True)
 class Response:
     printed: bool = False
     message: str = ""
@@ -35,6 +45,11 @@ class Response:
         return cls(printed=False, message=msg, error=True)
 
 
+# Responses are frozen, so the common ones are shared rather than rebuilt
+EXIT_RESPONSE = Response(printed=False, message="__EXIT__")
+_PRINTED_OK   = Response(printed=True, message="Printed.")
+
+
 def dispatch(text: str, printer, config: dict) -> Response:
     """
     Parse text and act on it.
@@ -43,35 +58,42 @@ def dispatch(text: str, printer, config: dict) -> Response:
     ----------
     text    : raw input string from any interface
     printer : Printer instance
-    config  : the [printer] section of config.toml
+    config  : the calling interface's config section. Unused —
+              printer settings live on the Printer — but kept so
+              every interface makes the same call.
 
     Returns
     -------
     Response
     """
-    raw   = text.strip()
-    lower = raw.lower()
+    raw = text.strip()
 
     # ── Empty input ──────────────────────────────────────── #
     if not raw:
         try:
-            printer.print_text("")
+            printer.feed()
         except Exception as e:
             return Response.err(f"Printer error: {e}")
         return Response.ok("(blank line printed)")
 
+    # ── Long plain text — can't be a keyword ─────────────── #
+    if raw[0] != "!" and len(raw) > _MAX_KEYWORD_LEN:
+        return _print_plain(raw, printer)
+
+    kind, key = _classify(raw.lower())
+
     # ── Built-in commands ────────────────────────────────── #
-    if lower == "cut":
+    if kind == "cut":
         try:
-            printer.cut(config.get("bottom_margin_lines", 4))
+            printer.cut()
         except Exception as e:
             return Response.err(f"Printer error: {e}")
         return Response.ok("Paper cut.")
 
-    if lower in ("exit", "quit"):
-        return Response(printed=False, message="__EXIT__")
+    if kind == "exit":
+        return EXIT_RESPONSE
 
-    if lower in ("help", "shortcuts"):
+    if kind == "help":
         names = list_shortcuts()
         lines = ["Available shortcuts:"]
         lines += [f"  !{n}" for n in names]
@@ -79,19 +101,62 @@ def dispatch(text: str, printer, config: dict) -> Response:
         return Response.ok("\n".join(lines), printed=False)
 
     # ── Shortcut lookup ──────────────────────────────────── #
-    result = resolve(lower)
-    if result is not None:
-        text_to_print, opts = result
+    if kind == "shortcut":
+        text_to_print, opts = resolve(key)
         try:
             printer.print_text(text_to_print, **opts)
         except Exception as e:
             return Response.err(f"Printer error: {e}")
-        return Response.ok(f"Shortcut '{lower.lstrip('!')}' printed.")
+        return Response.ok(f"Shortcut '{key}' printed.")
 
     # ── Plain text ───────────────────────────────────────── #
+    return _print_plain(raw, printer)
+
+
+def is_command(text: str) -> bool:
+    """
+    True if dispatch() would treat text as a command or shortcut
+    rather than plain text to print.
+    """
+    raw = text.strip()
+    if not raw or (raw[0] != "!" and len(raw) > _MAX_KEYWORD_LEN):
+        return False
+    return _classify(raw.lower())[0] != "text"
+
+
+@lru_cache(maxsize=512)
+def _classify(lower: str) -> tuple:
+    """
+    Work out what a lowercased, non-empty line is asking for.
+
+    Returns (kind, key) where kind is "cut", "exit", "help",
+    "shortcut" or "text", and key is the shortcut name for
+    "shortcut" (None otherwise). Pure, so repeated lines —
+    the same !shortcut typed again — are a cache hit.
+    """
+    if lower == "cut":
+        return "cut", None
+    if lower in _EXIT_CMDS:
+        return "exit", None
+    if lower in _HELP_CMDS:
+        return "help", None
+
+    # Bare keywords are already clean — only "!name" needs trimming
+    if lower[0] != "!":
+        return ("shortcut", lower) if lower in SHORTCUTS else ("text", None)
+
+    key = lower.lstrip("!").strip()
+    if key in SHORTCUTS:
+        return "shortcut", key
+
+    return "text", None
+
+
+def _print_plain(raw: str, printer) -> Response:
+    """Print a line that isn't a command or shortcut."""
     try:
         printer.print_text(raw)
     except Exception as e:
         return Response.err(f"Printer error: {e}")
 
-    return Response.ok("Printed.")
\ No newline at end of file
+    return _PRINTED_OK
\ No newline at end of file
@@ -8,24 +8,83 @@ All other modules talk to this one — nothing else
 imports escpos directly.
 
 Key design decisions:
-  - Lazy connection: nothing crashes at import time
-    if the printer is off or disconnected.
-  - Auto-reconnect: if the printer disappears mid-session,
-    the next print call retries automatically.
+  - Background connection: a daemon thread opens the USB
+    device and keeps retrying while the printer is off. A
+    failed write drops the handle and wakes it to reconnect.
+    Nothing crashes at import time if it's disconnected.
+  - Fail fast: print calls never wait for the printer.
+    While it's offline they raise PrinterError at once.
   - Thread-safe: web and CLI can print simultaneously
     without corrupting each other.
 """
 
 import logging
-import textwrap
-import time
-from threading import Lock
+from threading import Event, Lock, Thread
 
 logger = logging.getLogger(__name__)
 
+# Code page used when config doesn't set one (TM-T88V power-on default)
+DEFAULT_ENCODING = "cp437"
+
+# Largest single USB write; longer payloads go out in chunks this size
+_MAX_WRITE = 1 << 20
+
+# Encoded control bytes dropped by print_char — everything below space but \n, and DEL
+_CONTROL = bytes(c for c in range(0x20) if c != 0x0A) + b"\x7f"
+
+# str.translate table for print_chars: deletes Latin-1 range non-printables but \n
+_KEEP = str.maketrans("", "", "".join(
+    chr(c) for c in range(256) if not (chr(c).isprintable() or c == 0x0A)
+))
+
+# What escpos's cut() sends: ESC d 6 (feed six lines), then GS V 0 (full cut)
+_CUT = b"\x1bd\x06" + b"\x1dV\x00"
+
+
+def _wrap_fixed(para: str, width: int) -> list:
+    """
+    Word-wrap one paragraph to a fixed column width.
+
+    The printer font is monospace, so width is just a character
+    count. Each line breaks at the last space that fits; a word
+    longer than a whole line is hard-broken at width. Spaces at
+    a break are dropped. Leading indentation is kept unless the
+    first word doesn't fit beside it — the same lines
+    textwrap.wrap(break_long_words=False, break_on_hyphens=False)
+    gives whenever every word fits on a line.
+    """
+    para = para.expandtabs()
+
+    # An indent wider than a line is dropped outright
+    indent = len(para) - len(para.lstrip(" "))
+    if indent > width:
+        para = para[indent:]
+
+    n = len(para)
+    lines = []
+    start = 0
+
+    while n - start > width:
+        cut = para.rfind(" ", start, start + width + 1)
+        if cut != -1:             # cut == start: indent too wide for the word
+            line = para[start:cut].rstrip(" ")
+            if line:              # indent alone doesn't make a line
+                lines.append(line)
+            start = cut + 1
+        else:
+            lines.append(para[start:start + width])
+            start += width
+        while start < n and para[start] == " ":
+            start += 1
+
+    tail = para[start:].rstrip()
+    if tail:
+        lines.append(tail)
+    return lines
+
 
 class PrinterError(Exception):
-    """Raised when the printer is unreachable after retrying."""
+    """Raised when the printer is offline."""
 
 
 class Printer:
@@ -40,115 +99,223 @@ class Printer:
 
     def __init__(self, config: dict):
         self._cfg = config
-        self._dev = None      # escpos USB instance, None until first use
+        self._dev = None      # escpos USB instance, None while offline
         self._lock = Lock()   # one print at a time
+        self._encoding = config.get("encoding", DEFAULT_ENCODING)
+        self._composed = {}   # (text, raw) → bytes, for print_text(cache=True)
+        self._status_etag = 0  # bumped on every connect/disconnect
+
+        # Fixed command bytes — config doesn't change at runtime
+        units = config.get("margin_units", 60)
+        self._margin_cmd = b"\x1d\x4c" + bytes([units % 256, units // 256])  # GS L
+        self._cut_cmd = b"\n" * config.get("bottom_margin_lines", 4) + _CUT
+
+        self._wake = Event()  # set to make the reconnect thread retry now
+        self._reconnect_thread = Thread(
+            target=self._reconnect_loop,
+            daemon=True,
+            name="printer-reconnect",
+        )
+        self._reconnect_thread.start()
 
     # ──────────────────────────────────────────
     #  Public API
     # ──────────────────────────────────────────
 
-    def print_text(self, text: str, raw: bool = False) -> None:
+    def print_text(self, text: str, raw: bool = False, cache: bool = False) -> None:
         """
         Send text to the printer.
 
         raw=False (default): word-wrapped to chars_per_line.
         raw=True: sent as-is, preserving spacing. Use for ASCII art.
+        cache=True: text never changes (static shortcuts), so keep
+        its encoded bytes and skip wrapping/encoding next time.
         """
-        with self._lock:
-            dev = self._get_connection()
-            self._set_left_margin(dev)
-
-            if raw:
-                dev.text(text if text.endswith("\n") else text + "\n")
-                return
-
-            if text.strip() == "":
-                dev.text("\n")
-                return
-
-            width = self._cfg.get("chars_per_line", 37)
-            for para in text.splitlines():
-                if not para.strip():
-                    dev.text("\n")
-                    continue
-                for line in textwrap.wrap(
-                    para,
-                    width=width,
-                    break_long_words=False,
-                    break_on_hyphens=False,
-                ):
-                    dev.text(line + "\n")
+        buf = self._composed.get((text, raw)) if cache else None
+        if buf is None:
+            buf = self._compose(text, raw)
+            if cache:
+                self._composed[(text, raw)] = buf
+        self._emit(buf)
 
     def print_char(self, char: str) -> None:
         """
         Print a single character immediately.
         Used by live (typewriter) mode in the CLI and web UI.
         """
-        with self._lock:
-            dev = self._get_connection()
-            if char == "\n":
-                dev.text("\n")
-            elif char.isprintable():
-                dev.text(char)
+        char = char[:1]
+        # ASCII controls go in the translate below; past ASCII, drop
+        # non-printables (U+200B, U+2028, ...) before they become "?"
+        if char > "\x7f" and not char.isprintable():
+            return
+        data = char.encode(self._encoding, "replace").translate(None, _CONTROL)
+        if data:
+            self._emit(data)
+
+    def feed(self, lines: int = 1) -> None:
+        """
+        Advance the paper by blank lines.
+        Raw newlines, no text formatting.
+        """
+        self._emit(b"\n" * lines)
+
+    def print_chars(self, chars: str) -> None:
+        """
+        Print a run of characters as-is — no wrapping, no added newline.
+        Used to send a burst of keystrokes (per_key live style, POST
+        /chars) as one USB write instead of one per character.
+        """
+        if not chars.isprintable():   # usual burst has nothing to strip
+            chars = chars.translate(_KEEP)
+            # _KEEP only spans U+0000-U+00FF; rarer non-printables one by one
+            if not chars.replace("\n", "").isprintable():
+                chars = "".join(c for c in chars if c == "\n" or c.isprintable())
+        if not chars:
+            return
+        self._emit(chars.encode(self._encoding, "replace"))
 
     def cut(self, lines: int = None) -> None:
         """Feed blank lines then cut the paper."""
-        if lines is None:
-            lines = self._cfg.get("bottom_margin_lines", 4)
-        with self._lock:
-            dev = self._get_connection()
-            dev.text("\n" * lines)
-            dev.cut()
+        self._emit(self._cut_cmd if lines is None else b"\n" * lines + _CUT)
 
     def is_connected(self) -> bool:
         """True if we currently have a live USB handle."""
         return self._dev is not None
 
+    @property
+    def status_etag(self) -> str:
+        """
+        Changes whenever the connection comes or goes. Odd means
+        connected, even means not, so a tag always maps to one state.
+        """
+        return str(self._status_etag)
+
     # ──────────────────────────────────────────
     #  Internal helpers
     # ──────────────────────────────────────────
 
     def _get_connection(self):
         """
-        Return a live escpos device, reconnecting if needed.
-        Must be called with self._lock already held.
+        Return the live escpos device, or raise PrinterError at once
+        if there isn't one. Never waits — the reconnect thread does that.
+        """
+        dev = self._dev
+        if dev is None:
+            raise PrinterError("Printer offline.")
+        return dev
+
+    def _reconnect_loop(self) -> None:
         """
-        if self._dev is not None:
-            return self._dev
+        Background thread: keep a USB connection open.
 
+        Sleeps while connected; mark_disconnected() wakes it to try
+        again. Connecting never happens under the print lock, so
+        callers get PrinterError right away instead of hanging.
+        """
         interval = self._cfg.get("reconnect_interval", 3)
         attempts = 0
 
         while True:
+            if self._dev is not None:
+                self._wake.wait()
+                self._wake.clear()
+                continue
+
             try:
                 from escpos.printer import Usb
                 dev = Usb(
                     self._cfg["vendor_id"],
                     self._cfg["product_id"],
                 )
-                self._dev = dev
-                logger.info("Printer connected after %d attempt(s).", attempts + 1)
-                return dev
+                # Pin the code page so our pre-encoded bytes print as intended
+                dev.charcode(self._encoding.upper())
+                # Margin persists on the printer — once per connection is enough
+                dev._raw(self._margin_cmd)
             except Exception as exc:
                 attempts += 1
-                logger.warning(
+                # Loud once, then quiet — the printer may be off for hours
+                log = logger.warning if attempts == 1 else logger.debug
+                log(
                     "Printer not reachable (attempt %d): %s — retrying in %ds.",
                     attempts,
                     exc,
                     interval,
                 )
-                time.sleep(interval)
+                self._wake.wait(interval)
+                self._wake.clear()
+                continue
+
+            with self._lock:
+                self._dev = dev
+                self._status_etag += 1
+            logger.info("Printer connected after %d attempt(s).", attempts + 1)
+            attempts = 0
+
+    def _compose(self, text: str, raw: bool) -> bytes:
+        """
+        Build the exact bytes print_text sends: wrapped and encoded,
+        ready to go out as one USB write.
+        """
+        if raw:
+            out = text if text.endswith("\n") else text + "\n"
+        elif text.strip() == "":
+            out = "\n"
+        else:
+            width = self._cfg.get("chars_per_line", 37)
+            lines = []
+            for para in text.splitlines():
+                if not para.strip():
+                    lines.append("")
+                    continue
+                lines += _wrap_fixed(para, width)
+            lines.append("")      # trailing newline, without a second copy
+            out = "\n".join(lines)
+
+        return out.encode(self._encoding, "replace")
+
+    def _emit(self, data: bytes) -> None:
+        """
+        Write finished bytes to the printer. The only step done under
+        the lock — wrapping and encoding happen before callers get here.
+        """
+        with self._lock:
+            dev = self._get_connection()
+            try:
+                self._write(dev, data)
+            except Exception as exc:
+                # Unplugged or power-cycled — the handle is dead now
+                self._drop_connection(dev)
+                raise PrinterError(f"Printer write failed: {exc}") from exc
 
-    def _set_left_margin(self, dev) -> None:
-        """Send ESC/POS GS L command to set the hardware left margin."""
-        units = self._cfg.get("margin_units", 60)
-        nL = units % 256
-        nH = units // 256
-        dev._raw(b"\x1d\x4c" + bytes([nL, nH]))
+    @staticmethod
+    def _write(dev, data: bytes) -> None:
+        """Send raw bytes in as few USB writes as possible."""
+        if len(data) <= _MAX_WRITE:
+            dev._raw(data)
+            return
+        view = memoryview(data)
+        for i in range(0, len(data), _MAX_WRITE):
+            dev._raw(bytes(view[i:i + _MAX_WRITE]))
 
     def mark_disconnected(self) -> None:
         """
         Call this if you catch a USB error outside this class.
-        Forces a reconnect on the next print attempt.
+        Wakes the reconnect thread to open the device again.
+        """
+        with self._lock:
+            self._drop_connection(self._dev)
+
+    def _drop_connection(self, dev) -> None:
         """
-        self._dev = None
\ No newline at end of file
+        Forget dev if it's still the current device and wake the
+        reconnect thread. Caller holds the lock, so the etag flips
+        exactly once per disconnect.
+        """
+        if dev is not None and self._dev is dev:
+            self._dev = None
+            self._status_etag += 1
+            try:
+                dev.close()
+            except Exception:
+                pass
+        self._wake.set()
\ No newline at end of file
@@ -30,6 +30,7 @@ Type the keyword with or without a leading "!".
 Both "time" and "!time" work from any interface.
 """
 
+import json
 from datetime import datetime
 
 
@@ -116,6 +117,30 @@ SHORTCUTS: dict = {
 }
 
 
+# ── Normalised lookup table ───────────────────────────────────────── #
+
+def _normalize(entry) -> tuple:
+    """
+    Put an entry in its final (text_or_callable, opts) form.
+
+    Static entries never change, but their bytes depend on the
+    printer's encoding and chars_per_line — so their opts ask the
+    printer to keep what it composes (cache=True) rather than
+    encoding anything here.
+    """
+    if callable(entry):
+        return entry, {}
+    text, opts = entry if isinstance(entry, tuple) else (entry, {})
+    return text, {**opts, "cache": True}
+
+
+# Built once at import — resolve() is then a single dict lookup
+_NORM: dict = {key.lower(): _normalize(entry) for key, entry in SHORTCUTS.items()}
+SHORTCUT_KEYS: list = sorted(SHORTCUTS)
+# Body of the web UI's GET /shortcuts, ready to send
+SHORTCUT_JSON: bytes = json.dumps({"shortcuts": SHORTCUT_KEYS}).encode()
+
+
 # ── Resolver ──────────────────────────────────────────────────────── #
 
 def resolve(keyword: str):
@@ -130,25 +155,20 @@ def resolve(keyword: str):
     (text: str, opts: dict)   if found
     None                      if not found
     """
-    key = keyword.lstrip("!").strip().lower()
-    entry = SHORTCUTS.get(key)
-
+    # dispatch() already hands over the bare lowercase key, so try it as-is
+    entry = _NORM.get(keyword) or _NORM.get(keyword.lstrip("!").strip().lower())
     if entry is None:
         return None
 
-    # Resolve callables — dynamic shortcuts run here
-    if callable(entry):
-        entry = entry()
-
-    # Normalise to (text, opts)
-    if isinstance(entry, tuple):
-        text, opts = entry
-    else:
-        text, opts = entry, {}
+    text, opts = entry
+    if not callable(text):
+        return entry
 
-    return text, opts
+    # Dynamic shortcuts run here, and may return (text, opts) themselves
+    text = text()
+    return text if isinstance(text, tuple) else (text, opts)
 
 
 def list_shortcuts() -> list:
     """Return a sorted list of all shortcut keywords."""
-    return sorted(SHORTCUTS.keys())
\ No newline at end of file
+    return SHORTCUT_KEYS
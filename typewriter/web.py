@@ -10,41 +10,87 @@ Routes
 ──────
   GET  /          → serves the UI
   POST /print     → receives text, calls dispatch()
+  POST /char      → prints one character (live typing)
+  POST /chars     → prints a burst of characters in one write
   GET  /status    → printer connection status
   GET  /shortcuts → list of available shortcuts
+
+/print takes JSON {"text": "..."}. /char and /chars take the
+characters themselves as the raw UTF-8 request body — no JSON.
 """
 
+import gzip
+import hashlib
+import json
 import logging
 import threading
 
-from flask import Flask, jsonify, render_template_string, request
+from flask import Flask, Response, jsonify, request
 
 from .dispatcher import dispatch
+from .shortcuts import SHORTCUT_JSON
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 logger = logging.getLogger(__name__)
 
+# Largest request body accepted — a /print line is never near this
+MAX_BODY = 64 * 1024
 
-def create_app(printer, config: dict):
-    from .shortcuts import list_shortcuts
 
+def create_app(printer, config: dict):
     app = Flask(__name__)
+    app.config["MAX_CONTENT_LENGTH"] = MAX_BODY
 
     @app.route("/")
     def index():
-        return render_template_string(HTML)
+        # Compressed once at import — pick the best one the browser takes
+        enc = request.accept_encodings.best_match(_HTML_ENCODED)
+        if enc is None:
+            resp = Response(_HTML_BYTES, mimetype="text/html")
+            resp.set_etag(_HTML_ETAG)
+        else:
+            resp = Response(_HTML_ENCODED[enc], mimetype="text/html")
+            resp.content_encoding = enc
+            resp.set_etag(f"{_HTML_ETAG}-{enc}")
+        resp.vary.add("Accept-Encoding")
+        resp.cache_control.public = True
+        resp.cache_control.max_age = 3600
+        return resp.make_conditional(request)
 
     @app.route("/status")
     def status():
-        return jsonify(connected=printer.is_connected())
+        # Polled by every open tab — answer 304 unless the state changed
+        etag = printer.status_etag
+        if request.if_none_match.contains(etag):
+            resp = Response(status=304)
+        else:
+            resp = jsonify(connected=printer.is_connected())
+        resp.set_etag(etag)
+        resp.cache_control.no_cache = True
+        return resp
 
     @app.route("/shortcuts")
     def shortcuts():
-        return jsonify(shortcuts=list_shortcuts())
+        return Response(SHORTCUT_JSON, mimetype="application/json")
 
     @app.route("/print", methods=["POST"])
     def print_line():
-        data = request.get_json(force=True)
-        text = data.get("text", "")
+        try:
+            data = _json_loads(request.get_data(cache=False))
+        except ValueError:
+            data = None
+        text = data.get("text", "") if isinstance(data, dict) else None
+        if not isinstance(text, str):
+            return jsonify(error=True, message='Expected {"text": "..."}.'), 400
         resp = dispatch(text, printer, config)
         return jsonify(
             printed=resp.printed,
@@ -54,8 +100,7 @@ def create_app(printer, config: dict):
 
     @app.route("/char", methods=["POST"])
     def print_char():
-        data = request.get_json(force=True)
-        ch = data.get("char", "")
+        ch = request.get_data(cache=False).decode("utf-8", "replace")[:1]
         if ch:
             try:
                 printer.print_char(ch)
@@ -63,35 +108,66 @@ def create_app(printer, config: dict):
                 return jsonify(error=True, message=str(e))
         return jsonify(ok=True)
 
+    @app.route("/chars", methods=["POST"])
+    def print_chars():
+        chars = request.get_data(cache=False).decode("utf-8", "replace")
+        if chars:
+            try:
+                printer.print_chars(chars)
+            except Exception as e:
+                return jsonify(error=True, message=str(e))
+        return jsonify(ok=True)
+
     return app
 
 
 def run(printer, config: dict):
-    """Start Flask in a daemon thread."""
+    """Start the web server in a daemon thread."""
     app = create_app(printer, config)
     host = config.get("host", "0.0.0.0")
     port = config.get("port", 5000)
+    threads = config.get("threads", 8)
     logger.info("Web UI starting on http://%s:%d", host, port)
-    
- # Silence Flask's per-request logging
-    import logging
-    log = logging.getLogger('werkzeug')
-    log.setLevel(logging.ERROR)
 
-    
     t = threading.Thread(
-        target=lambda: app.run(
-            host=host,
-            port=port,
-            debug=False,
-            use_reloader=False
-        ),
+        target=_serve,
+        args=(app, host, port, threads),
         daemon=True,
         name="web-server",
     )
     t.start()
     return t
 
+
+def _serve(app, host: str, port: int, threads: int):
+    """
+    Serve with waitress (fixed pool of worker threads).
+    Falls back to Flask's development server if it isn't installed.
+
+    Waitress already multiplexes every open connection on one
+    event-loop thread; the pool only runs handlers. poll() instead
+    of select() lets that loop hold more than 1024 sockets.
+    """
+    try:
+        from waitress import create_server
+    except ImportError:
+        logger.warning("waitress not installed — using Flask's dev server.")
+        # Silence Flask's per-request logging
+        logging.getLogger("werkzeug").setLevel(logging.ERROR)
+        app.run(host=host, port=port, debug=False, use_reloader=False)
+        return
+
+    # create_server() rather than serve(): no logging.basicConfig()
+    # behind our back, no "Serving on" banner
+    create_server(
+        app,
+        host=host,
+        port=port,
+        threads=threads,
+        asyncore_use_poll=True,
+    ).run()
+
+
 HTML = """<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -380,4 +456,14 @@ msgEl.addEventListener('keydown', async (e) => {
 });
 </script>
 </body>
-</html>"""
\ No newline at end of file
+</html>"""
+
+# HTML has no template variables, so it's served as fixed bytes
+_HTML_BYTES = HTML.encode("utf-8")
+_HTML_ETAG = hashlib.md5(_HTML_BYTES).hexdigest()
+
+# Content-Encoding → body, in order of preference
+_HTML_ENCODED = {}
+if brotli is not None:
+    _HTML_ENCODED["br"] = brotli.compress(_HTML_BYTES)
+_HTML_ENCODED["gzip"] = gzip.compress(_HTML_BYTES, 9, mtime=0)